@@ -1,10 +1,54 @@
+import time
+_DEBUT_SCRIPT = time.perf_counter()
+
 import streamlit as st
-import pandas as pd
+from streamlit.logger import get_logger
 import json
-import plotly.express as px
 from datetime import datetime
 import re
 import os
+import sys
+import importlib
+
+# ==================== CHRONOMÉTRAGE DU DÉMARRAGE ====================
+# Les modules lourds (pandas, plotly, et à terme sklearn, nltk, wordcloud,
+# statsmodels, PyMuPDF) ne sont importés qu'au premier usage via charger_module().
+# verifier_demarrage.py contrôle qu'ils restent hors du premier rendu.
+
+logger = get_logger("bumidom")
+
+def age_processus():
+    """Secondes écoulées depuis le lancement du processus serveur (None hors Linux)"""
+    try:
+        with open('/proc/self/stat') as f:
+            champs = f.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return uptime - int(champs[19]) / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+_chrono = {}
+_age_au_debut = age_processus()
+if _age_au_debut is not None:
+    # Démarrage Python + import du serveur Streamlit, et attente de la 1re session
+    _chrono['processus avant script'] = max(_age_au_debut - (time.perf_counter() - _DEBUT_SCRIPT), 0.0)
+
+def charger_module(nom):
+    """Importe un module à la première utilisation et chronomètre l'import"""
+    deja_charge = nom in sys.modules
+    debut = time.perf_counter()
+    module = importlib.import_module(nom)
+    if not deja_charge:
+        _chrono[f'import {nom}'] = time.perf_counter() - debut
+    return module
+
+@st.cache_resource
+def chrono_demarrage_a_froid(_chrono_premier_rendu):
+    """Fige le chronométrage du premier rendu de ce processus (partagé entre sessions)"""
+    reference = dict(_chrono_premier_rendu)
+    logger.info("Démarrage à froid: " + ", ".join(f"{k}={v*1000:.0f}ms" for k, v in reference.items()))
+    return reference
 
 # ==================== CONFIGURATION ====================
 st.set_page_config(page_title="Dashboard BUMIDOM", layout="wide")
@@ -357,6 +401,7 @@ with st.sidebar:
 
 if st.session_state.donnees:
     donnees = st.session_state.donnees
+    pd = charger_module('pandas')
     df = pd.DataFrame(donnees)
     
     # Interface à deux onglets
@@ -458,6 +503,7 @@ if st.session_state.donnees:
         
         # Visualisations
         st.subheader("📈 Visualisations")
+        px = charger_module('plotly.express')
         
         viz_tab1, viz_tab2, viz_tab3 = st.tabs(["Types", "Périodes", "Scores"])
         
@@ -654,3 +700,23 @@ else:
 # Pied de page
 st.divider()
 st.caption(f"Dashboard BUMIDOM • Consultation individuelle • {datetime.now().strftime('%d/%m/%Y %H:%M')} • Sélection: {st.session_state.selected_doc_id or 'Aucune'}")
+
+# ==================== RAPPORT DE DÉMARRAGE ====================
+
+duree_script = time.perf_counter() - _DEBUT_SCRIPT
+_chrono['rendu script'] = duree_script - sum(v for k, v in _chrono.items() if k.startswith('import '))
+_chrono['total script'] = duree_script
+if 'processus avant script' in _chrono:
+    _chrono['total depuis lancement'] = _chrono['processus avant script'] + duree_script
+
+# Seul le premier rendu du processus remplit la référence (verrou par clé de st.cache_resource)
+a_froid = chrono_demarrage_a_froid(_chrono)
+
+with st.sidebar.expander("⏱️ Chronométrage du démarrage", expanded=False):
+    st.markdown("**Démarrage à froid (1er rendu du processus):**")
+    for etape, duree in a_froid.items():
+        st.text(f"{etape:<25} {duree*1000:8.0f} ms")
+    st.markdown("**Rendu courant:**")
+    for etape, duree in _chrono.items():
+        if etape not in ('processus avant script', 'total depuis lancement'):
+            st.text(f"{etape:<25} {duree*1000:8.0f} ms")
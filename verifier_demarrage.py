@@ -0,0 +1,55 @@
+"""Contrôle de non-régression du démarrage à froid du dashboard BUMIDOM.
+
+Usage: python verifier_demarrage.py   (code de sortie 1 en cas de régression)
+
+Vérifie, dans un processus neuf, que le premier rendu (écran d'accueil)
+n'importe aucun module lourd et reste sous le budget de temps.
+"""
+import sys
+import time
+
+DEBUT = time.perf_counter()
+
+from streamlit.testing.v1 import AppTest
+
+SCRIPT = "dashboard_bumidom_pdf.py"
+MODULES_LOURDS = ['pandas', 'numpy', 'pyarrow', 'plotly.express', 'sklearn', 'nltk',
+                  'wordcloud', 'statsmodels', 'fitz', 'matplotlib']
+BUDGET_IMPORT_S = 2.0
+BUDGET_RENDU_S = 1.0
+
+
+def verifier():
+    """Retourne la liste des régressions détectées"""
+    erreurs = []
+    duree_import = time.perf_counter() - DEBUT
+    deja_charges = [m for m in MODULES_LOURDS if m in sys.modules]
+    if deja_charges:
+        erreurs.append(f"Streamlit importe déjà: {', '.join(deja_charges)}")
+
+    debut_rendu = time.perf_counter()
+    at = AppTest.from_file(SCRIPT, default_timeout=30).run()
+    duree_rendu = time.perf_counter() - debut_rendu
+
+    if at.exception:
+        erreurs.append(f"Exception au premier rendu: {at.exception[0].message}")
+    charges = [m for m in MODULES_LOURDS if m in sys.modules and m not in deja_charges]
+    if charges:
+        erreurs.append(f"Modules lourds chargés au premier rendu: {', '.join(charges)}")
+    if duree_import > BUDGET_IMPORT_S:
+        erreurs.append(f"Import streamlit: {duree_import:.2f}s > {BUDGET_IMPORT_S}s")
+    if duree_rendu > BUDGET_RENDU_S:
+        erreurs.append(f"Premier rendu: {duree_rendu:.2f}s > {BUDGET_RENDU_S}s")
+
+    print(f"Import streamlit: {duree_import*1000:.0f} ms (budget {BUDGET_IMPORT_S*1000:.0f} ms)")
+    print(f"Premier rendu:    {duree_rendu*1000:.0f} ms (budget {BUDGET_RENDU_S*1000:.0f} ms)")
+    return erreurs
+
+
+if __name__ == "__main__":
+    erreurs = verifier()
+    for erreur in erreurs:
+        print(f"❌ {erreur}")
+    if not erreurs:
+        print("✅ Démarrage à froid conforme")
+    sys.exit(1 if erreurs else 0)